@@ -0,0 +1,16 @@
+"""Ahead-of-time build of the scoring kernel; run `python scoring_aot.py` to emit scoring_native"""
+from pathlib import Path
+
+from numba.pycc import CC
+
+from scoring_kernel import _score_kernel
+
+cc = CC('scoring_native')
+cc.output_dir = str(Path(__file__).parent)
+
+@cc.export('score_kernel', 'Tuple((f8, i1, i1))(f8, f8, f8, f8, f8, f8, f8, b1)')
+def score_kernel(on_time, total, elec, mob, util, loan, tenure, has_consumption_data):
+    return _score_kernel(on_time, total, elec, mob, util, loan, tenure, has_consumption_data)
+
+if __name__ == '__main__':
+    cc.compile()
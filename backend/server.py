@@ -1,21 +1,33 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
+import asyncio
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Any
 import uuid
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import time
+from cachetools import TLRUCache, TTLCache
 from datetime import datetime, timezone, timedelta
 import bcrypt
 import jwt
-import random
+import orjson
 import numpy as np
 from sklearn.preprocessing import MinMaxScaler
 from emergentintegrations.llm.chat import LlmChat, UserMessage
+from scoring_kernel import score_batch, RISK_BANDS, INCOME_CATS
+try:
+    # Ahead-of-time build from scoring_aot.py, which skips JIT compilation on the first request
+    from scoring_native import score_kernel
+except ImportError:
+    from scoring_kernel import _score_kernel as score_kernel
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -30,11 +42,41 @@ JWT_SECRET = os.environ.get('JWT_SECRET', 'secret')
 JWT_ALGORITHM = 'HS256'
 JWT_EXPIRATION = 24  # hours
 
+# Verified tokens, keyed by a sha256 prefix of the token and held as (User, exp);
+# an entry lives at most TOKEN_CACHE_TTL seconds and never past the token's own exp
+TOKEN_CACHE_TTL = 60  # seconds
+_token_cache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, value, now: min(now + TOKEN_CACHE_TTL, value[1]),
+    timer=time.time
+)
+
+# AI explanation prompt
+AI_SYSTEM_MESSAGE = "You are a credit scoring expert for NBCFDC lending platform. Provide concise, professional explanations."
+AI_PROMPT_TEMPLATE = """Analyze this beneficiary's credit profile:
+        - Name: {name}
+        - Credit Score: {score:.2f}/100
+        - Risk Band: {risk_band}
+        - Loan Amount: ₹{loan_amount}
+        - Repayment History: {repayment_count} records
+        - Business Type: {business_type}
+        
+        Provide:
+        1. A brief explanation (2-3 sentences) of why they received this score
+        2. Three specific recommendations to improve their creditworthiness
+        
+        Format as JSON: {{"explanation": "...", "recommendations": ["...", "...", "..."]}}"""
+
+# Parsed LLM answers, keyed by sha256 of the rendered prompt
+AI_CACHE_TTL = 3600  # seconds
+_explanation_cache = TTLCache(maxsize=2048, ttl=AI_CACHE_TTL)
+
 # Security
 security = HTTPBearer()
+BCRYPT_ROUNDS = 10
 
 # Create the main app
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 # Models
@@ -116,7 +158,7 @@ class LoanApplicationCreate(BaseModel):
 
 # Helper Functions
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
 
 def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
@@ -127,14 +169,20 @@ def create_token(user_id: str) -> str:
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    token = credentials.credentials
+    cache_key = hashlib.sha256(token.encode('utf-8')).digest()[:16]
+    cached = _token_cache.get(cache_key)
+    if cached:
+        return cached[0]
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         user_id = payload.get("user_id")
         user = await db.users.find_one({"id": user_id}, {"_id": 0})
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
-        return User(**user)
+        user_obj = User(**user)
+        _token_cache[cache_key] = (user_obj, payload["exp"])
+        return user_obj
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except Exception:
@@ -142,138 +190,90 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
 
 def calculate_credit_score(beneficiary: Dict[str, Any]) -> tuple:
     """Calculate credit score based on repayment history and consumption data"""
-    score_components = []
-    
-    # Repayment Score (40% weight)
-    repayment_history = beneficiary.get('repayment_history', [])
-    if repayment_history:
-        on_time = sum(1 for r in repayment_history if r.get('status') == 'on_time')
-        total = len(repayment_history)
-        repayment_score = (on_time / total) * 40
-        score_components.append(repayment_score)
-    else:
-        score_components.append(20)  # Default moderate score for new beneficiaries
-    
-    # Consumption-based Income Score (30% weight)
-    consumption = beneficiary.get('consumption_data', {})
+    get = beneficiary.get
+    repayment_history = get('repayment_history') or ()
+    on_time = 0
+    for record in repayment_history:
+        if record.get('status') == 'on_time':
+            on_time += 1
+    
+    consumption = get('consumption_data')
     if consumption:
-        electricity = consumption.get('electricity_kwh', 0) or 0
-        mobile = consumption.get('mobile_recharge_monthly', 0) or 0
-        utility = consumption.get('utility_bill_avg', 0) or 0
-        
-        # Normalize consumption metrics
-        consumption_score = 0
-        if electricity > 0:
-            # Higher electricity (up to threshold) indicates better income
-            consumption_score += min((electricity / 300) * 10, 10)
-        if mobile > 0:
-            consumption_score += min((mobile / 500) * 10, 10)
-        if utility > 0:
-            consumption_score += min((utility / 2000) * 10, 10)
-        
-        score_components.append(consumption_score)
-    else:
-        score_components.append(15)  # Default score without consumption data
-    
-    # Loan Utilization Score (20% weight)
-    loan_amount = beneficiary.get('loan_amount', 0)
-    if 10000 <= loan_amount <= 100000:  # Optimal loan range
-        utilization_score = 20
-    elif loan_amount < 10000:
-        utilization_score = 15
-    else:
-        utilization_score = 10
-    score_components.append(utilization_score)
-    
-    # Tenure Score (10% weight)
-    tenure = beneficiary.get('loan_tenure_months', 12)
-    if 12 <= tenure <= 36:
-        tenure_score = 10
-    else:
-        tenure_score = 5
-    score_components.append(tenure_score)
-    
-    # Calculate final score (0-100)
-    final_score = sum(score_components)
-    
-    # Determine Risk Band
-    consumption = beneficiary.get('consumption_data', {})
-    has_consumption = consumption and any([
-        consumption.get('electricity_kwh'),
-        consumption.get('mobile_recharge_monthly'),
-        consumption.get('utility_bill_avg')
-    ])
-    
-    # Income category based on consumption
-    if has_consumption:
-        electricity = consumption.get('electricity_kwh', 0) or 0
-        mobile = consumption.get('mobile_recharge_monthly', 0) or 0
-        total_consumption = electricity + mobile
-        
-        if total_consumption > 500:
-            income_category = "Medium Income"
-        elif total_consumption > 200:
-            income_category = "Low-Medium Income"
-        else:
-            income_category = "Low Income"
+        cget = consumption.get
+        electricity = float(cget('electricity_kwh') or 0.0)
+        mobile = float(cget('mobile_recharge_monthly') or 0.0)
+        utility = float(cget('utility_bill_avg') or 0.0)
     else:
-        income_category = "Income Not Assessed"
-    
-    # Risk band classification
-    if final_score >= 75:
-        if income_category in ["Low Income", "Low-Medium Income"]:
-            risk_band = "Low Risk - High Need"
-        else:
-            risk_band = "Low Risk - Low Need"
-    elif final_score >= 50:
-        if income_category in ["Low Income", "Low-Medium Income"]:
-            risk_band = "Medium Risk - High Need"
-        else:
-            risk_band = "Medium Risk - Low Need"
-    else:
-        if income_category in ["Low Income", "Low-Medium Income"]:
-            risk_band = "High Risk - High Need"
-        else:
-            risk_band = "High Risk - Low Need"
+        electricity = mobile = utility = 0.0
+    
+    final_score, risk_idx, income_idx = score_kernel(
+        float(on_time), float(len(repayment_history)),
+        electricity, mobile, utility,
+        float(get('loan_amount', 0)),
+        float(get('loan_tenure_months', 12)),
+        bool(consumption)
+    )
     
-    return final_score, risk_band, income_category
+    return final_score, RISK_BANDS[risk_idx], INCOME_CATS[income_idx]
 
 async def generate_ai_explanation(beneficiary: Dict[str, Any], score: float, risk_band: str) -> tuple:
     """Generate AI-powered explanation for credit score"""
     try:
+        prompt = AI_PROMPT_TEMPLATE.format(
+            name=beneficiary['name'],
+            score=score,
+            risk_band=risk_band,
+            loan_amount=beneficiary['loan_amount'],
+            repayment_count=len(beneficiary.get('repayment_history', [])),
+            business_type=beneficiary['business_type']
+        )
+        
+        # Identical profiles render identical prompts, so reuse the earlier answer
+        digest = hashlib.sha256(prompt.encode('utf-8')).digest()
+        cached = _explanation_cache.get(digest)
+        if cached:
+            return cached
+        
         chat = LlmChat(
             api_key=os.environ.get('EMERGENT_LLM_KEY'),
             session_id=f"credit_score_{beneficiary['id']}",
-            system_message="You are a credit scoring expert for NBCFDC lending platform. Provide concise, professional explanations."
+            system_message=AI_SYSTEM_MESSAGE
         ).with_model("openai", "gpt-4o-mini")
         
-        prompt = f"""Analyze this beneficiary's credit profile:
-        - Name: {beneficiary['name']}
-        - Credit Score: {score:.2f}/100
-        - Risk Band: {risk_band}
-        - Loan Amount: ₹{beneficiary['loan_amount']}
-        - Repayment History: {len(beneficiary.get('repayment_history', []))} records
-        - Business Type: {beneficiary['business_type']}
-        
-        Provide:
-        1. A brief explanation (2-3 sentences) of why they received this score
-        2. Three specific recommendations to improve their creditworthiness
-        
-        Format as JSON: {{"explanation": "...", "recommendations": ["...", "...", "..."]}}"""
-        
         message = UserMessage(text=prompt)
         response = await chat.send_message(message)
         
         # Parse AI response
-        import json
-        ai_data = json.loads(response)
-        return ai_data.get('explanation', 'Score calculated based on repayment history and consumption data.'), \
-               ai_data.get('recommendations', ['Maintain regular repayments', 'Update consumption data', 'Build credit history'])
+        ai_data = orjson.loads(response)
+        result = ai_data.get('explanation', 'Score calculated based on repayment history and consumption data.'), \
+                 ai_data.get('recommendations', ['Maintain regular repayments', 'Update consumption data', 'Build credit history'])
+        _explanation_cache[digest] = result
+        return result
     except Exception as e:
         logging.error(f"AI explanation error: {e}")
         return "Score calculated based on repayment history, consumption patterns, and loan utilization.", \
                ["Maintain timely repayments", "Provide complete consumption data", "Build longer credit history"]
 
+def stream_json_array(cursor) -> StreamingResponse:
+    """Stream a Motor cursor as a JSON array, encoding one document at a time"""
+    cursor.batch_size(200)
+    
+    async def iter_docs():
+        yield b'['
+        first = True
+        async for doc in cursor:
+            yield orjson.dumps(doc) if first else b',' + orjson.dumps(doc)
+            first = False
+        yield b']'
+    
+    return StreamingResponse(iter_docs(), media_type='application/json')
+
+async def save_credit_score(beneficiary_id: str, score: float, risk_band: str, income_category: str):
+    await db.beneficiaries.update_one(
+        {"id": beneficiary_id},
+        {"$set": {"credit_score": score, "risk_band": risk_band, "income_category": income_category}}
+    )
+
 # Auth Routes
 @api_router.post("/auth/register", response_model=TokenResponse)
 async def register(user_data: UserCreate):
@@ -284,9 +284,8 @@ async def register(user_data: UserCreate):
     
     # Create user
     user_obj = User(username=user_data.username, email=user_data.email)
-    user_dict = user_obj.model_dump()
-    user_dict['password'] = hash_password(user_data.password)
-    user_dict['created_at'] = user_dict['created_at'].isoformat()
+    user_dict = user_obj.model_dump(mode='json')
+    user_dict['password'] = await asyncio.to_thread(hash_password, user_data.password)
     
     await db.users.insert_one(user_dict)
     token = create_token(user_obj.id)
@@ -296,7 +295,7 @@ async def register(user_data: UserCreate):
 @api_router.post("/auth/login", response_model=TokenResponse)
 async def login(credentials: UserLogin):
     user = await db.users.find_one({"email": credentials.email}, {"_id": 0})
-    if not user or not verify_password(credentials.password, user['password']):
+    if not user or not await asyncio.to_thread(verify_password, credentials.password, user['password']):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     user_obj = User(**user)
@@ -312,14 +311,9 @@ async def borrower_register(data: BeneficiaryCreate):
     
     # Create beneficiary account
     beneficiary = Beneficiary(**data.model_dump())
-    beneficiary_dict = beneficiary.model_dump()
+    beneficiary_dict = beneficiary.model_dump(mode='json')
     beneficiary_dict['email'] = data.email if hasattr(data, 'email') else f"{data.name.lower().replace(' ', '')}@borrower.com"
-    beneficiary_dict['password'] = hash_password(data.password if hasattr(data, 'password') else 'password123')
-    beneficiary_dict['created_at'] = beneficiary_dict['created_at'].isoformat()
-    beneficiary_dict['repayment_history'] = [
-        {**r, 'payment_date': r['payment_date'].isoformat()} 
-        for r in beneficiary_dict['repayment_history']
-    ]
+    beneficiary_dict['password'] = await asyncio.to_thread(hash_password, data.password if hasattr(data, 'password') else 'password123')
     
     await db.beneficiaries.insert_one(beneficiary_dict)
     token = create_token(beneficiary.id)
@@ -329,7 +323,7 @@ async def borrower_register(data: BeneficiaryCreate):
 @api_router.post("/borrower/login")
 async def borrower_login(credentials: UserLogin):
     beneficiary = await db.beneficiaries.find_one({"email": credentials.email}, {"_id": 0})
-    if not beneficiary or not verify_password(credentials.password, beneficiary.get('password', '')):
+    if not beneficiary or not await asyncio.to_thread(verify_password, credentials.password, beneficiary.get('password', '')):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     token = create_token(beneficiary['id'])
@@ -352,25 +346,26 @@ async def get_borrower_loans(current_user: User = Depends(get_current_user)):
     return loans
 
 # Beneficiary Routes
-@api_router.get("/beneficiaries", response_model=List[Beneficiary])
+@api_router.get("/beneficiaries")
 async def get_beneficiaries(current_user: User = Depends(get_current_user)):
-    beneficiaries = await db.beneficiaries.find({}, {"_id": 0}).to_list(1000)
-    return beneficiaries
+    # Only the fields the dashboard cards use; repayment statuses are kept so the record count survives
+    projection = {
+        "_id": 0, "id": 1, "name": 1, "age": 1, "business_type": 1, "loan_amount": 1,
+        "loan_tenure_months": 1, "credit_score": 1, "risk_band": 1, "income_category": 1,
+        "repayment_history.status": 1
+    }
+    return stream_json_array(db.beneficiaries.find({}, projection).limit(1000))
 
 @api_router.post("/beneficiaries", response_model=Beneficiary)
 async def create_beneficiary(data: BeneficiaryCreate, current_user: User = Depends(get_current_user)):
-    beneficiary = Beneficiary(**data.model_dump())
-    beneficiary_dict = beneficiary.model_dump()
-    beneficiary_dict['created_at'] = beneficiary_dict['created_at'].isoformat()
-    
-    # Serialize repayment history
-    beneficiary_dict['repayment_history'] = [
-        {**r, 'payment_date': r['payment_date'].isoformat()} 
-        for r in beneficiary_dict['repayment_history']
-    ]
+    now = datetime.now(timezone.utc)
+    beneficiary_id = str(uuid.uuid4())
+    defaults = {"repayment_history": [], "credit_score": None, "risk_band": None, "income_category": None}
+    beneficiary_dict = {"id": beneficiary_id, **data.model_dump(mode='json'), **defaults, "created_at": now.isoformat()}
     
     await db.beneficiaries.insert_one(beneficiary_dict)
-    return beneficiary
+    # Every field is already validated, so build the response model without re-validating
+    return Beneficiary.model_construct(id=beneficiary_id, **dict(data), **defaults, created_at=now)
 
 @api_router.get("/beneficiaries/{beneficiary_id}", response_model=Beneficiary)
 async def get_beneficiary(beneficiary_id: str, current_user: User = Depends(get_current_user)):
@@ -388,14 +383,14 @@ async def calculate_score(beneficiary_id: str, current_user: User = Depends(get_
     # Calculate score
     score, risk_band, income_category = calculate_credit_score(beneficiary)
     
+    # Update beneficiary while the AI explanation is generated
+    saved = asyncio.create_task(save_credit_score(beneficiary_id, score, risk_band, income_category))
+    
     # Generate AI explanation
     explanation, recommendations = await generate_ai_explanation(beneficiary, score, risk_band)
     
-    # Update beneficiary
-    await db.beneficiaries.update_one(
-        {"id": beneficiary_id},
-        {"$set": {"credit_score": score, "risk_band": risk_band, "income_category": income_category}}
-    )
+    # Clients reload the beneficiary as soon as this returns, so the write must land first
+    await saved
     
     return CreditScoreResult(
         credit_score=score,
@@ -433,95 +428,142 @@ async def apply_loan(data: LoanApplicationCreate, current_user: User = Depends(g
     credit_score = beneficiary['credit_score']
     status = "approved" if credit_score >= 60 else "rejected"
     
-    application = LoanApplication(
+    now = datetime.now(timezone.utc)
+    processed_at = now if status != "pending" else None
+    application = LoanApplication.model_construct(
+        id=str(uuid.uuid4()),
         beneficiary_id=data.beneficiary_id,
         loan_amount=data.loan_amount,
         loan_purpose=data.loan_purpose,
         status=status,
-        processed_at=datetime.now(timezone.utc) if status != "pending" else None
+        created_at=now,
+        processed_at=processed_at
     )
     
-    app_dict = application.model_dump()
-    app_dict['created_at'] = app_dict['created_at'].isoformat()
-    if app_dict['processed_at']:
-        app_dict['processed_at'] = app_dict['processed_at'].isoformat()
+    app_dict = {
+        "id": application.id,
+        "beneficiary_id": data.beneficiary_id,
+        "loan_amount": data.loan_amount,
+        "loan_purpose": data.loan_purpose,
+        "status": status,
+        "created_at": now.isoformat(),
+        "processed_at": processed_at.isoformat() if processed_at else None
+    }
     
     await db.loan_applications.insert_one(app_dict)
     return application
 
-@api_router.get("/loans", response_model=List[LoanApplication])
+@api_router.get("/loans")
 async def get_loan_applications(current_user: User = Depends(get_current_user)):
-    applications = await db.loan_applications.find({}, {"_id": 0}).to_list(1000)
-    return applications
+    projection = {
+        "_id": 0, "id": 1, "beneficiary_id": 1, "loan_amount": 1, "loan_purpose": 1,
+        "status": 1, "created_at": 1, "processed_at": 1
+    }
+    return stream_json_array(db.loan_applications.find({}, projection).limit(1000))
 
 # Mock Data Generation
+MOCK_BUSINESS_TYPES = ("Retail Shop", "Handicrafts", "Agriculture", "Small Manufacturing", "Services", "Food Business")
+MOCK_NAMES = (
+    "Rajesh Kumar", "Priya Sharma", "Amit Patel", "Sunita Devi", "Vikram Singh", "Lakshmi Iyer",
+    "Ramesh Reddy", "Anjali Gupta", "Suresh Yadav", "Kavita Verma", "Mohan Das", "Meera Nair"
+)
+REPAYMENT_STATUSES = ('on_time', 'delayed', 'missed')
+REPAYMENT_STATUS_WEIGHTS = (0.7, 0.2, 0.1)
+
 @api_router.post("/mock-data/generate")
-async def generate_mock_data(count: int = 10, current_user: User = Depends(get_current_user)):
+async def generate_mock_data(count: int = Query(10, ge=0, le=10000), current_user: User = Depends(get_current_user)):
     """Generate realistic mock beneficiary data"""
-    business_types = ["Retail Shop", "Handicrafts", "Agriculture", "Small Manufacturing", "Services", "Food Business"]
-    names = ["Rajesh Kumar", "Priya Sharma", "Amit Patel", "Sunita Devi", "Vikram Singh", "Lakshmi Iyer", 
-             "Ramesh Reddy", "Anjali Gupta", "Suresh Yadav", "Kavita Verma", "Mohan Das", "Meera Nair"]
-    
-    generated = []
-    for i in range(count):
-        # Generate repayment history
-        num_loans = random.randint(1, 5)
-        repayment_history = []
-        for j in range(num_loans):
-            status_choice = random.choices(
-                ['on_time', 'delayed', 'missed'],
-                weights=[0.7, 0.2, 0.1]
-            )[0]
-            repayment_history.append({
-                "loan_id": f"LOAN{random.randint(1000, 9999)}",
-                "amount_paid": random.uniform(5000, 50000),
-                "payment_date": (datetime.now(timezone.utc) - timedelta(days=random.randint(30, 365))).isoformat(),
-                "status": status_choice
-            })
-        
-        # Generate consumption data
-        consumption = {
-            "electricity_kwh": random.uniform(50, 400),
-            "mobile_recharge_monthly": random.uniform(100, 800),
-            "utility_bill_avg": random.uniform(500, 3000)
+    # Sample every per-beneficiary field as a whole column
+    rng = np.random.default_rng()
+    elec = rng.uniform(50, 400, count)
+    mob = rng.uniform(100, 800, count)
+    util = rng.uniform(500, 3000, count)
+    loan = rng.uniform(10000, 200000, count)
+    tenure = rng.choice([12, 24, 36, 48], count)
+    age = rng.integers(25, 61, count)
+    name_idx = rng.integers(0, len(MOCK_NAMES), count)
+    business_idx = rng.integers(0, len(MOCK_BUSINESS_TYPES), count)
+    
+    # Generate repayment histories as one flat batch of records, split per beneficiary below
+    num_loans = rng.integers(1, 6, count)
+    num_records = int(num_loans.sum())
+    status_idx = rng.choice(len(REPAYMENT_STATUSES), p=REPAYMENT_STATUS_WEIGHTS, size=num_records)
+    loan_ids = rng.integers(1000, 10000, num_records)
+    amounts = rng.uniform(5000, 50000, num_records)
+    days_ago = rng.integers(30, 366, num_records)
+    
+    on_time = np.bincount(np.repeat(np.arange(count), num_loans), weights=status_idx == 0, minlength=count)
+    total = num_loans.astype(np.float64)
+    
+    now = datetime.now(timezone.utc)
+    records = [
+        {
+            "loan_id": f"LOAN{loan_id}",
+            "amount_paid": amount,
+            "payment_date": (now - timedelta(days=days)).isoformat(),
+            "status": REPAYMENT_STATUSES[status]
         }
-        
-        beneficiary = {
-            "id": str(uuid.uuid4()),
-            "name": random.choice(names),
-            "age": random.randint(25, 60),
-            "business_type": random.choice(business_types),
-            "loan_amount": random.uniform(10000, 200000),
-            "loan_tenure_months": random.choice([12, 24, 36, 48]),
-            "repayment_history": repayment_history,
-            "consumption_data": consumption,
-            "created_at": datetime.now(timezone.utc).isoformat()
+        for loan_id, amount, days, status in zip(loan_ids.tolist(), amounts.tolist(), days_ago.tolist(), status_idx.tolist())
+    ]
+    ends = np.cumsum(num_loans).tolist()
+    histories = [records[start:end] for start, end in zip([0] + ends[:-1], ends)]
+    
+    # Score all rows at once over the sampled columns
+    scores, risk_idx, income_idx = score_batch(on_time, total, elec, mob, util, loan, tenure)
+    
+    # One urandom call for every id in the batch, stamped as version-4 UUIDs
+    raw = os.urandom(16 * count)
+    ids = [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+    
+    rows = zip(
+        ids, histories, elec.tolist(), mob.tolist(), util.tolist(), loan.tolist(), tenure.tolist(),
+        age.tolist(), name_idx.tolist(), business_idx.tolist(),
+        scores.tolist(), risk_idx.tolist(), income_idx.tolist()
+    )
+    beneficiaries = [
+        {
+            "id": beneficiary_id,
+            "name": MOCK_NAMES[n],
+            "age": a,
+            "business_type": MOCK_BUSINESS_TYPES[bt],
+            "loan_amount": l,
+            "loan_tenure_months": t,
+            "repayment_history": history,
+            "consumption_data": {
+                "electricity_kwh": e,
+                "mobile_recharge_monthly": m,
+                "utility_bill_avg": u
+            },
+            "created_at": now.isoformat(),
+            "credit_score": score,
+            "risk_band": RISK_BANDS[r_idx],
+            "income_category": INCOME_CATS[i_idx]
         }
-        
-        # Calculate initial score
-        score, risk_band, income_category = calculate_credit_score(beneficiary)
-        beneficiary['credit_score'] = score
-        beneficiary['risk_band'] = risk_band
-        beneficiary['income_category'] = income_category
-        
-        await db.beneficiaries.insert_one(beneficiary)
-        generated.append(beneficiary['id'])
+        for beneficiary_id, history, e, m, u, l, t, a, n, bt, score, r_idx, i_idx in rows
+    ]
     
-    return {"message": f"Generated {count} mock beneficiaries", "ids": generated}
+    if beneficiaries:
+        await db.beneficiaries.insert_many(beneficiaries, ordered=False)
+    
+    return {"message": f"Generated {count} mock beneficiaries", "ids": ids}
 
 # Stats endpoint
 @api_router.get("/stats")
 async def get_stats(current_user: User = Depends(get_current_user)):
-    total_beneficiaries = await db.beneficiaries.count_documents({})
-    total_applications = await db.loan_applications.count_documents({})
-    approved_loans = await db.loan_applications.count_documents({"status": "approved"})
+    total_beneficiaries, total_applications, approved_loans = await asyncio.gather(
+        db.beneficiaries.count_documents({}),
+        db.loan_applications.count_documents({}),
+        db.loan_applications.count_documents({"status": "approved"})
+    )
     
     # Risk band distribution
-    beneficiaries = await db.beneficiaries.find({"risk_band": {"$exists": True}}, {"_id": 0, "risk_band": 1}).to_list(1000)
+    pipeline = [
+        {"$match": {"risk_band": {"$exists": True}}},
+        {"$group": {"_id": "$risk_band", "n": {"$sum": 1}}}
+    ]
     risk_distribution = {}
-    for b in beneficiaries:
-        band = b.get('risk_band', 'Unknown')
-        risk_distribution[band] = risk_distribution.get(band, 0) + 1
+    async for doc in db.beneficiaries.aggregate(pipeline):
+        risk_distribution[doc['_id']] = doc['n']
     
     return {
         "total_beneficiaries": total_beneficiaries,
@@ -548,6 +590,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def configure_executor():
+    # Bounded pool for asyncio.to_thread work such as bcrypt hashing
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=os.cpu_count()))
+
+@app.on_event("startup")
+async def create_indexes():
+    await db.users.create_index("email", unique=True)
+    await db.users.create_index("id", unique=True)
+    await db.beneficiaries.create_index("id", unique=True)
+    await db.beneficiaries.create_index("email")
+    await db.beneficiaries.create_index("risk_band")
+    await db.loan_applications.create_index("beneficiary_id")
+    await db.loan_applications.create_index([("status", 1)])
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
\ No newline at end of file
@@ -1,66 +1,115 @@
-import requests
+import httpx
+import orjson
+import asyncio
+import os
 import sys
 import json
 from datetime import datetime
 import time
+import logging
+import logging.handlers
+
+log = logging.getLogger("nbcfdc_test")
+log.setLevel(os.environ.get("NBCFDC_TEST_LOG_LEVEL", "INFO"))  # DEBUG also logs failing response bodies
+
+# API under test; override to point the checks at another deployment
+API_URL_ENV = "NBCFDC_API_URL"
+API_URL = os.environ.get(API_URL_ENV, "https://credit-insight-2.preview.emergentagent.com/api")
+
+# Fixed request bodies, encoded once
+CONSUMPTION_BODY = orjson.dumps({
+    "electricity_kwh": 250.5,
+    "mobile_recharge_monthly": 400.0,
+    "utility_bill_avg": 1800.0
+})
 
 class NBCFDCAPITester:
-    def __init__(self, base_url="https://credit-insight-2.preview.emergentagent.com/api"):
+    # Fields each response must carry
+    REQUIRED_STATS = frozenset(('total_beneficiaries', 'total_applications', 'approved_loans', 'approval_rate'))
+    REQUIRED_BENEFICIARY = frozenset(('id', 'name', 'business_type', 'loan_amount'))
+    REQUIRED_BENEFICIARY_DETAIL = frozenset(('id', 'name', 'business_type', 'loan_amount', 'repayment_history'))
+    REQUIRED_SCORE = frozenset(('credit_score', 'risk_band', 'income_category', 'explanation', 'recommendations'))
+    REQUIRED_LOAN = frozenset(('id', 'beneficiary_id', 'loan_amount', 'status'))
+    DEFAULT_HEADERS = {'Content-Type': 'application/json'}
+
+    def __init__(self, base_url=API_URL):
         self.base_url = base_url
         self.token = None
         self.tests_run = 0
         self.tests_passed = 0
         self.test_user_id = None
         self.test_beneficiary_id = None
+        self.client = None  # httpx.AsyncClient, see open()
+        self.timings = []  # (name, status_code, elapsed_ns) per request
+
+    async def open(self):
+        """Open the HTTP/2 client shared by every test; pair with close()"""
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            timeout=30.0,
+            headers=self.DEFAULT_HEADERS,
+            limits=httpx.Limits(max_connections=10, keepalive_expiry=30)
+        )
+
+    async def close(self):
+        await self.client.aclose()
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, params=None):
-        """Run a single API test"""
-        url = f"{self.base_url}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        if self.token:
-            headers['Authorization'] = f'Bearer {self.token}'
+    def set_token(self, token):
+        """Attach the bearer token to every later request, or drop it when token is None"""
+        self.token = token
+        if token is None:
+            self.client.headers.pop('Authorization', None)
+        else:
+            self.client.headers['Authorization'] = f'Bearer {token}'
 
+    def _require(self, response, fields, label):
+        """Log and return False when `response` lacks any of `fields`"""
+        missing = fields.difference(response)
+        if missing:
+            log.error("❌ Missing fields in %s: %s", label, sorted(missing))
+            return False
+        return True
+
+    async def run_test(self, name, method, endpoint, expected_status, data=None, params=None, body=None):
+        """Run a single API test; pass a JSON-serializable `data` or pre-encoded JSON `body` bytes"""
         self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
+        log.info("\n🔍 Testing %s...", name)
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, params=params)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, params=params)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers)
+            started = time.perf_counter_ns()
+            response = await self.client.request(method, endpoint, json=data, content=body, params=params)
+            self.timings.append((name, response.status_code, time.perf_counter_ns() - started))
 
             success = response.status_code == expected_status
             if success:
                 self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
+                log.info("✅ Passed - Status: %s", response.status_code)
                 try:
-                    return success, response.json()
-                except:
+                    return success, orjson.loads(response.content)
+                except orjson.JSONDecodeError:
                     return success, {}
             else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
-                try:
-                    print(f"Response: {response.json()}")
-                except:
-                    print(f"Response text: {response.text}")
+                log.error("❌ Failed - Expected %s, got %s at %s", expected_status, response.status_code, response.url)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Response body: %r", response.content[:200])
                 return False, {}
 
         except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
+            log.error("❌ Failed - Error: %s", e)
             return False, {}
 
-    def test_auth_register(self):
+    async def test_auth_register(self):
         """Test user registration"""
-        timestamp = int(time.time())
+        # Timestamp plus pid keeps parallel xdist workers from registering the same email
+        timestamp = f"{int(time.time())}_{os.getpid()}"
         test_data = {
             "username": f"testuser_{timestamp}",
             "email": f"test_{timestamp}@example.com",
             "password": "TestPass123!"
         }
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "User Registration",
             "POST",
             "auth/register",
@@ -69,26 +118,26 @@ class NBCFDCAPITester:
         )
         
         if success and 'token' in response:
-            self.token = response['token']
+            self.set_token(response['token'])
             self.test_user_id = response['user']['id']
-            print(f"✅ User registered with ID: {self.test_user_id}")
+            log.info("✅ User registered with ID: %s", self.test_user_id)
             return True
         return False
 
-    def test_auth_login(self):
+    async def test_auth_login(self):
         """Test user login with existing credentials"""
         # Try to login with the registered user
         if not self.test_user_id:
-            print("❌ No test user available for login test")
+            log.error("❌ No test user available for login test")
             return False
             
         # For this test, we'll use the token from registration
         # In a real scenario, we'd test login separately
         return True
 
-    def test_stats_endpoint(self):
+    async def test_stats_endpoint(self):
         """Test stats endpoint"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Stats",
             "GET",
             "stats",
@@ -96,17 +145,14 @@ class NBCFDCAPITester:
         )
         
         if success:
-            required_fields = ['total_beneficiaries', 'total_applications', 'approved_loans', 'approval_rate']
-            for field in required_fields:
-                if field not in response:
-                    print(f"❌ Missing field in stats: {field}")
-                    return False
-            print(f"✅ Stats: {response['total_beneficiaries']} beneficiaries, {response['total_applications']} applications")
+            if not self._require(response, self.REQUIRED_STATS, "stats"):
+                return False
+            log.info("✅ Stats: %s beneficiaries, %s applications", response['total_beneficiaries'], response['total_applications'])
         return success
 
-    def test_generate_mock_data(self):
+    async def test_generate_mock_data(self):
         """Test mock data generation"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Generate Mock Data",
             "POST",
             "mock-data/generate",
@@ -115,39 +161,37 @@ class NBCFDCAPITester:
         )
         
         if success and 'ids' in response:
-            print(f"✅ Generated {len(response['ids'])} mock beneficiaries")
+            log.info("✅ Generated %d mock beneficiaries", len(response['ids']))
             return True
         return success
 
-    def test_get_beneficiaries(self):
+    async def test_get_beneficiaries(self):
         """Test getting beneficiaries list"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Beneficiaries",
             "GET",
             "beneficiaries",
             200
         )
         
-        if success and isinstance(response, list):
-            if len(response) > 0:
-                self.test_beneficiary_id = response[0]['id']
-                print(f"✅ Found {len(response)} beneficiaries")
-                # Check required fields in first beneficiary
-                required_fields = ['id', 'name', 'business_type', 'loan_amount']
-                for field in required_fields:
-                    if field not in response[0]:
-                        print(f"❌ Missing field in beneficiary: {field}")
-                        return False
-            return True
+        if success and response:
+            # Prefer an already-scored beneficiary: the loan application runs
+            # alongside the score calculation rather than after it
+            scored = [b for b in response if b.get('credit_score')]
+            self.test_beneficiary_id = (scored or response)[0]['id']
+            log.info("✅ Found %d beneficiaries", len(response))
+            # Check required fields in first beneficiary
+            if not self._require(response[0], self.REQUIRED_BENEFICIARY, "beneficiary"):
+                return False
         return success
 
-    def test_get_beneficiary_detail(self):
+    async def test_get_beneficiary_detail(self):
         """Test getting individual beneficiary"""
         if not self.test_beneficiary_id:
-            print("❌ No test beneficiary ID available")
+            log.error("❌ No test beneficiary ID available")
             return False
             
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Beneficiary Detail",
             "GET",
             f"beneficiaries/{self.test_beneficiary_id}",
@@ -155,46 +199,37 @@ class NBCFDCAPITester:
         )
         
         if success:
-            required_fields = ['id', 'name', 'business_type', 'loan_amount', 'repayment_history']
-            for field in required_fields:
-                if field not in response:
-                    print(f"❌ Missing field in beneficiary detail: {field}")
-                    return False
-            print(f"✅ Beneficiary details loaded for: {response['name']}")
+            if not self._require(response, self.REQUIRED_BENEFICIARY_DETAIL, "beneficiary detail"):
+                return False
+            log.info("✅ Beneficiary details loaded for: %s", response['name'])
         return success
 
-    def test_update_consumption_data(self):
+    async def test_update_consumption_data(self):
         """Test updating consumption data"""
         if not self.test_beneficiary_id:
-            print("❌ No test beneficiary ID available")
+            log.error("❌ No test beneficiary ID available")
             return False
             
-        consumption_data = {
-            "electricity_kwh": 250.5,
-            "mobile_recharge_monthly": 400.0,
-            "utility_bill_avg": 1800.0
-        }
-        
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Update Consumption Data",
             "PUT",
             f"beneficiaries/{self.test_beneficiary_id}/consumption",
             200,
-            data=consumption_data
+            body=CONSUMPTION_BODY
         )
         
         if success:
-            print("✅ Consumption data updated successfully")
+            log.info("✅ Consumption data updated successfully")
         return success
 
-    def test_calculate_credit_score(self):
+    async def test_calculate_credit_score(self):
         """Test credit score calculation with AI"""
         if not self.test_beneficiary_id:
-            print("❌ No test beneficiary ID available")
+            log.error("❌ No test beneficiary ID available")
             return False
             
-        print("⏳ Calculating credit score (this may take a few seconds for AI processing)...")
-        success, response = self.run_test(
+        log.info("⏳ Calculating credit score (this may take a few seconds for AI processing)...")
+        success, response = await self.run_test(
             "Calculate Credit Score",
             "POST",
             f"beneficiaries/{self.test_beneficiary_id}/score",
@@ -202,22 +237,19 @@ class NBCFDCAPITester:
         )
         
         if success:
-            required_fields = ['credit_score', 'risk_band', 'income_category', 'explanation', 'recommendations']
-            for field in required_fields:
-                if field not in response:
-                    print(f"❌ Missing field in score result: {field}")
-                    return False
+            if not self._require(response, self.REQUIRED_SCORE, "score result"):
+                return False
             
-            print(f"✅ Credit Score: {response['credit_score']:.1f}/100")
-            print(f"✅ Risk Band: {response['risk_band']}")
-            print(f"✅ AI Explanation: {response['explanation'][:100]}...")
-            print(f"✅ Recommendations: {len(response['recommendations'])} provided")
+            log.info("✅ Credit Score: %.1f/100", response['credit_score'])
+            log.info("✅ Risk Band: %s", response['risk_band'])
+            log.info("✅ AI Explanation: %.100s...", response['explanation'])
+            log.info("✅ Recommendations: %d provided", len(response['recommendations']))
         return success
 
-    def test_loan_application(self):
+    async def test_loan_application(self):
         """Test loan application with auto-approval"""
         if not self.test_beneficiary_id:
-            print("❌ No test beneficiary ID available")
+            log.error("❌ No test beneficiary ID available")
             return False
             
         loan_data = {
@@ -226,7 +258,7 @@ class NBCFDCAPITester:
             "loan_purpose": "Business expansion"
         }
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Apply for Loan",
             "POST",
             "loans/apply",
@@ -235,40 +267,34 @@ class NBCFDCAPITester:
         )
         
         if success:
-            required_fields = ['id', 'beneficiary_id', 'loan_amount', 'status']
-            for field in required_fields:
-                if field not in response:
-                    print(f"❌ Missing field in loan application: {field}")
-                    return False
+            if not self._require(response, self.REQUIRED_LOAN, "loan application"):
+                return False
             
-            print(f"✅ Loan Application Status: {response['status']}")
-            print(f"✅ Application ID: {response['id']}")
+            log.info("✅ Loan Application Status: %s", response['status'])
+            log.info("✅ Application ID: %s", response['id'])
         return success
 
-    def test_get_loan_applications(self):
+    async def test_get_loan_applications(self):
         """Test getting loan applications"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Loan Applications",
             "GET",
             "loans",
             200
         )
         
-        if success and isinstance(response, list):
-            print(f"✅ Found {len(response)} loan applications")
-            if len(response) > 0:
+        if success:
+            log.info("✅ Found %d loan applications", len(response))
+            if response:
                 # Check required fields in first application
-                required_fields = ['id', 'beneficiary_id', 'loan_amount', 'status']
-                for field in required_fields:
-                    if field not in response[0]:
-                        print(f"❌ Missing field in loan application: {field}")
-                        return False
+                if not self._require(response[0], self.REQUIRED_LOAN, "loan application"):
+                    return False
         return success
 
-    def test_invalid_endpoints(self):
+    async def test_invalid_endpoints(self):
         """Test error handling for invalid requests"""
         # Test invalid beneficiary ID
-        success, _ = self.run_test(
+        success, _ = await self.run_test(
             "Invalid Beneficiary ID",
             "GET",
             "beneficiaries/invalid-id",
@@ -276,53 +302,92 @@ class NBCFDCAPITester:
         )
         
         if success:
-            print("✅ Proper 404 handling for invalid beneficiary ID")
+            log.info("✅ Proper 404 handling for invalid beneficiary ID")
         
         return success
 
-def main():
-    print("🚀 Starting NBCFDC Credit Scoring Platform API Tests")
-    print("=" * 60)
+async def run_category(category, test_func):
+    log.info("\n%s %s %s", '=' * 20, category, '=' * 20)
+    try:
+        await test_func()
+    except Exception as e:
+        log.error("❌ Test category failed with exception: %s", e)
+
+async def main():
+    log.info("🚀 Starting NBCFDC Credit Scoring Platform API Tests")
+    log.info("=" * 60)
     
     tester = NBCFDCAPITester()
     
-    # Test sequence
-    test_sequence = [
-        ("Authentication", tester.test_auth_register),
+    # Test sequence: registration first (it sets the token), then tests that need
+    # nothing else run concurrently, then the chain that shares test_beneficiary_id.
+    # The slow AI scoring call runs in the background while the chain's remaining
+    # requests proceed.
+    independent_tests = [
         ("Stats Endpoint", tester.test_stats_endpoint),
         ("Mock Data Generation", tester.test_generate_mock_data),
+    ]
+    beneficiary_chain = [
         ("Get Beneficiaries", tester.test_get_beneficiaries),
         ("Get Beneficiary Detail", tester.test_get_beneficiary_detail),
         ("Update Consumption Data", tester.test_update_consumption_data),
-        ("Calculate Credit Score", tester.test_calculate_credit_score),
+    ]
+    overlapped_tests = [
         ("Loan Application", tester.test_loan_application),
         ("Get Loan Applications", tester.test_get_loan_applications),
         ("Error Handling", tester.test_invalid_endpoints),
     ]
     
-    print(f"\n📋 Running {len(test_sequence)} test categories...")
+    log.info("\n📋 Running %d test categories...", 2 + len(independent_tests) + len(beneficiary_chain) + len(overlapped_tests))
     
-    for category, test_func in test_sequence:
-        print(f"\n{'='*20} {category} {'='*20}")
-        try:
-            test_func()
-        except Exception as e:
-            print(f"❌ Test category failed with exception: {str(e)}")
+    await tester.open()
+    try:
+        await run_category("Authentication", tester.test_auth_register)
+        await asyncio.gather(*(run_category(category, test_func) for category, test_func in independent_tests))
+        for category, test_func in beneficiary_chain:
+            await run_category(category, test_func)
+        score_task = asyncio.create_task(run_category("Calculate Credit Score", tester.test_calculate_credit_score))
+        await asyncio.gather(*(run_category(category, test_func) for category, test_func in overlapped_tests))
+        await score_task
+    finally:
+        await tester.close()
     
     # Print final results
-    print(f"\n{'='*60}")
-    print(f"📊 FINAL RESULTS")
-    print(f"{'='*60}")
-    print(f"Tests Run: {tester.tests_run}")
-    print(f"Tests Passed: {tester.tests_passed}")
-    print(f"Success Rate: {(tester.tests_passed/tester.tests_run*100):.1f}%" if tester.tests_run > 0 else "0%")
+    log.info("\n%s", '=' * 60)
+    log.info("📊 FINAL RESULTS")
+    log.info('=' * 60)
+    log.info("Tests Run: %d", tester.tests_run)
+    log.info("Tests Passed: %d", tester.tests_passed)
+    if tester.tests_run > 0:
+        log.info("Success Rate: %.1f%%", tester.tests_passed / tester.tests_run * 100)
+    else:
+        log.info("0%")
+    
+    log.info("\n⏱️  Slowest requests:")
+    for name, status_code, elapsed_ns in sorted(tester.timings, key=lambda t: t[2], reverse=True)[:5]:
+        log.info("%10.1f ms  %s  %s", elapsed_ns / 1e6, status_code, name)
     
     if tester.tests_passed == tester.tests_run:
-        print("🎉 All tests passed! Backend API is working correctly.")
+        log.info("🎉 All tests passed! Backend API is working correctly.")
         return 0
     else:
-        print(f"⚠️  {tester.tests_run - tester.tests_passed} tests failed. Check the issues above.")
+        log.warning("⚠️  %d tests failed. Check the issues above.", tester.tests_run - tester.tests_passed)
         return 1
 
+def configure_logging():
+    """Buffer script output in memory and write it to stdout in one batch"""
+    handler = logging.handlers.MemoryHandler(
+        capacity=1000,
+        flushLevel=logging.CRITICAL,
+        target=logging.StreamHandler(sys.stdout)
+    )
+    log.addHandler(handler)
+    return handler
+
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    handler = configure_logging()
+    try:
+        exit_code = asyncio.run(main())
+    finally:
+        handler.close()
+    sys.exit(exit_code)
\ No newline at end of file
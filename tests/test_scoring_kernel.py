@@ -0,0 +1,44 @@
+"""Offline check that score_batch stays in step with the per-row _score_kernel."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+# Import under the same top-level name as server.py; numba's on-disk cache records
+# the module name, so loading it as backend.scoring_kernel breaks the server's cache
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from scoring_kernel import _score_kernel, score_batch
+
+ROWS = 5000
+
+
+def random_columns(rng, n):
+    """Random score inputs with zero readings and the loan/tenure rule boundaries mixed in"""
+    total = rng.integers(0, 6, n).astype(float)
+    on_time = np.floor(rng.random(n) * (total + 1))
+
+    def consumption():
+        values = rng.uniform(-50, 4000, n)
+        values[rng.random(n) < 0.1] = 0.0
+        return values
+
+    elec, mob, util = consumption(), consumption(), consumption()
+    loan = rng.uniform(1000, 200000, n)
+    boundary = rng.random(n) < 0.5
+    loan[boundary] = rng.choice([9999.99, 10000.0, 100000.0, 100000.01], boundary.sum())
+    tenure = rng.choice([6.0, 11.0, 12.0, 24.0, 36.0, 37.0, 48.0], n)
+    return on_time, total, elec, mob, util, loan, tenure
+
+
+def test_score_batch_matches_kernel():
+    columns = random_columns(np.random.default_rng(0), ROWS)
+    score, risk_idx, income_idx = score_batch(*columns)
+
+    expected = np.array([_score_kernel(*row, True) for row in zip(*columns)])
+    np.testing.assert_allclose(score, expected[:, 0])
+    np.testing.assert_array_equal(risk_idx, expected[:, 1])
+    np.testing.assert_array_equal(income_idx, expected[:, 2])